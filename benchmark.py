@@ -0,0 +1,427 @@
+"""Load test the main pages against a synthetic database.
+
+Seeds a fresh database with users, computers, tickets and technicians, then
+requests each page through the Flask test client (one request at a time) and
+through a threaded WSGI server (several clients at once). Reports p50/p95/p99
+latency, SQL queries per request and requests per second, and writes the
+results as JSON so runs can be diffed between versions.
+
+    python benchmark.py --users 2000 --tickets 20000 -o before.json
+    python benchmark.py -o after.json --compare before.json
+"""
+import http.client
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+
+import click
+
+FIRST_NAMES = ['Alex', 'Amara', 'Ben', 'Carmen', 'Chen', 'Dana', 'Diego', 'Elena', 'Farah', 'Gabriel', 'Hana',
+               'Ivan', 'Jamal', 'Jin', 'Kai', 'Laura', 'Leila', 'Marco', 'Maya', 'Nadia', 'Noah', 'Olga', 'Omar',
+               'Priya', 'Quinn', 'Rosa', 'Sam', 'Sofia', 'Tariq', 'Uma', 'Victor', 'Wei', 'Yara', 'Zoe']
+LAST_NAMES = ['Adams', 'Bauer', 'Costa', 'Dubois', 'Evans', 'Fischer', 'Garcia', 'Haddad', 'Ito', 'Jensen', 'Kim',
+              'Lopez', 'Martin', 'Nguyen', 'Okafor', 'Patel', 'Quinto', 'Rossi', 'Silva', 'Tanaka', 'Usman',
+              'Varga', 'Wang', 'Xu', 'Yilmaz', 'Zhang']
+DEPARTMENTS = ['Mathematics', 'Physics', 'Chemistry', 'Biology', 'History', 'English', 'Philosophy', 'Economics',
+               'Computer Science', 'Music', 'Art', 'Psychology', 'Sociology', 'Linguistics', 'Geology',
+               'Registrar', 'Admissions', 'Library', 'Facilities', 'Human Resources']
+COMPANIES = {'Dell': ['Latitude 5440', 'Latitude 7440', 'OptiPlex 7010', 'XPS 13', 'Precision 3660'],
+             'Apple': ['MacBook Air M2', 'MacBook Pro 14', 'iMac 24', 'Mac mini M2'],
+             'Lenovo': ['ThinkPad T14', 'ThinkPad X1 Carbon', 'ThinkCentre M70q', 'ThinkPad E14'],
+             'HP': ['EliteBook 840', 'ProBook 450', 'EliteDesk 800', 'ZBook Firefly'],
+             'Microsoft': ['Surface Laptop 5', 'Surface Pro 9']}
+CPUS = ['Intel Core i5-1345U', 'Intel Core i7-1365U', 'Intel Core i7-13700', 'Intel Core i9-13900', 'Apple M2',
+        'Apple M2 Pro', 'AMD Ryzen 5 7530U', 'AMD Ryzen 7 7840U']
+OSES = ['Windows 11', 'Windows 10', 'macOS 14', 'macOS 13', 'Ubuntu 22.04']
+ISSUES = ['Laptop will not boot', 'Printer not connecting', 'Cannot reach the VPN', 'Replace battery',
+          'Screen flickering', 'Install statistics software', 'Email not syncing', 'Keyboard keys sticking',
+          'Set up new docking station', 'Slow after update', 'Forgot password', 'Projector not detected',
+          'Migrate files to new computer', 'Wi-Fi drops in office', 'Blue screen on startup']
+LOCATIONS = ['Office', 'Home', 'HCS', 'Recycling Center']
+TICKET_STATUSES = ['Scheduled', 'Tentatively Scheduled', 'Further Research Needed']
+USERNAME = 'benchmark'
+PASSWORD = 'benchmark'
+
+
+def seed_database(m, users, computers, tickets, technicians, rng):
+    # Bulk inserts in the style of the CSV import; the search index triggers keep up as rows go in
+    from sqlalchemy import insert
+    from werkzeug.security import generate_password_hash
+    db = m.db
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+
+    def insert_rows(model, rows, chunk_size=5000):
+        for start in range(0, len(rows), chunk_size):
+            db.session.execute(insert(model), rows[start:start + chunk_size])
+
+    insert_rows(m.Technician, [{'id': i + 1, 'full_name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                                'email': f'tech{i}@example.edu', 'role': 'Admin' if i == 0 else 'Technician'}
+                               for i in range(technicians)])
+    insert_rows(m.TechnicianLogIn, [{'email': 'tech0@example.edu', 'username': USERNAME,
+                                     'password': generate_password_hash(PASSWORD), 'role': 'Admin'}])
+    models = [(company, model) for company, names in COMPANIES.items() for model in names]
+    insert_rows(m.Company, [{'id': i + 1, 'name': name} for i, name in enumerate(COMPANIES)])
+    insert_rows(m.Model, [{'id': i + 1, 'name': model} for i, (company, model) in enumerate(models)])
+    insert_rows(m.CPU, [{'id': i + 1, 'name': name} for i, name in enumerate(CPUS)])
+    insert_rows(m.OS, [{'id': i + 1, 'name': name} for i, name in enumerate(OSES)])
+    company_ids = {name: i + 1 for i, name in enumerate(COMPANIES)}
+
+    insert_rows(m.User, [{
+        'id': i + 1,
+        'full_name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+        'role': rng.choices(['Faculty', 'Staff', 'Other'], [5, 4, 1])[0],
+        'department': rng.choice(DEPARTMENTS),
+        'office_number': str(rng.randrange(100, 500)),
+        'uniID': f'U{i:07d}',
+        'email': f'user{i}@example.edu',
+        'office_location': f'Building {rng.randrange(1, 30)}',
+        'replacement_cycle_years': rng.choice([3, 4, 5]),
+    } for i in range(users)])
+
+    # Every user has a computer, the rest go to a few users with several machines
+    owners = list(range(1, users + 1)) + [rng.randrange(1, users // 10 + 2) for _ in range(max(computers - users, 0))]
+    computer_owners = {}
+    computer_rows = []
+    for i, owner in enumerate(owners[:computers]):
+        model_id = rng.randrange(len(models)) + 1
+        computer_owners.setdefault(owner, []).append(i + 1)
+        computer_rows.append({
+            'id': i + 1,
+            'computer_id': f'SN{i:08d}',
+            'company_id': company_ids[models[model_id - 1][0]],
+            'model_id': model_id,
+            'cpu_id': rng.randrange(len(CPUS)) + 1,
+            'os_id': rng.randrange(len(OSES)) + 1,
+            'assigned_user_id': owner,
+            'location': rng.choices(LOCATIONS, [80, 15, 3, 2])[0],
+            'room': str(rng.randrange(100, 500)),
+            'ram': rng.choice([8, 16, 16, 32]),
+            'storage': rng.choice([256, 512, 512, 1024]),
+            'date_inventoried': now - timedelta(days=rng.randrange(6 * 365)),
+            'price': float(rng.randrange(600, 3000)),
+        })
+    insert_rows(m.Computer, computer_rows)
+
+    # A handful of users file most tickets; most tickets are closed and in the past year,
+    # the open ones are spread over the next four weeks
+    ticket_rows = []
+    for i in range(tickets):
+        user_id = int(users * rng.random() ** 3) + 1
+        upcoming = rng.random() < 0.15
+        day = now + timedelta(days=rng.randrange(1, 29) if upcoming else -rng.randrange(1, 366))
+        ticket_rows.append({
+            'user_id': user_id,
+            'computer_id': rng.choice(computer_owners[user_id]) if rng.random() < 0.8 else None,
+            'issue_summary': rng.choice(ISSUES),
+            'status': rng.choice(TICKET_STATUSES) if upcoming else 'Closed',
+            'created_at': day - timedelta(days=rng.randrange(1, 14)),
+            'appointment_time': day.replace(hour=m.WORKDAY_START_HOUR) + timedelta(
+                minutes=15 * rng.randrange((m.WORKDAY_END_HOUR - m.WORKDAY_START_HOUR - 2) * 4)),
+            'appointment_length': rng.choice([15, 30, 30, 60, 60, 90, 120]),
+            'assigned_person_id': rng.randrange(technicians) + 1 if rng.random() < 0.9 else None,
+            'location': rng.choice(list(m.TRAVEL_BUFFER_MINUTES)),
+        })
+    insert_rows(m.Ticket, ticket_rows)
+    db.session.commit()
+
+    if db.engine.dialect.name == 'postgresql':
+        # Explicit ids leave the sequences behind
+        for table in ['technician', 'company', 'model', 'cpu', 'os', 'user', 'computer']:
+            db.session.execute(m.text(f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                                      f"(SELECT max(id) FROM \"{table}\"))"))
+        db.session.commit()
+    m.suggest_index.invalidate()
+    m.reference_data.invalidate()
+    m.schedule_index.invalidate()
+
+
+def page_requests(m, app, users, computers, technicians):
+    # Returns page name -> function(rng) -> (method, path, form data or None).
+    # Pages with a form are split into the GET that renders it and the POST that submits it.
+    with app.app_context():
+        computer_rows = m.computer_list_query().all()
+        serials = {c.id: (c.computer_id, c.company.name, c.model.name, c.cpu.name, c.os.name, c.assigned_user_id)
+                   for c in computer_rows}
+    models = [(company, model) for company, names in COMPANIES.items() for model in names]
+    counter = iter(range(10 ** 9))
+    lock = threading.Lock()
+
+    def search(rng):
+        return 'GET', '/search?' + urlencode({'q': rng.choice(FIRST_NAMES + LAST_NAMES + DEPARTMENTS)}), None
+
+    def add_ticket_form(rng):
+        return 'GET', '/add_ticket', None
+
+    def add_ticket_post(rng):
+        user_id = rng.randrange(users) + 1
+        return 'POST', '/add_ticket', {
+            'issue_summary': rng.choice(ISSUES), 'user_id': user_id, 'computer_id': '',
+            'appointment_date': (datetime.now() + timedelta(days=rng.randrange(1, 29))).strftime('%Y-%m-%d'),
+            'appointment_time': f'{rng.randrange(9, 16)}:{rng.choice(["00", "15", "30", "45"])}',
+            'status': 'Scheduled', 'appointment_length': rng.choice([30, 60]),
+            'assigned_person_id': rng.randrange(technicians) + 1, 'location': 'Remote', 'allow_overlap': 'on'}
+
+    def edit_computer_form(rng):
+        return 'GET', f'/edit_computer/{rng.randrange(computers) + 1}', None
+
+    def edit_computer_post(rng):
+        computer_id = rng.randrange(computers) + 1
+        serial, company, model, cpu, os_name, owner = serials[computer_id]
+        if rng.random() < 0.2:
+            company, model = rng.choice(models)
+        with lock:
+            room = str(100 + next(counter) % 400)
+        return 'POST', f'/edit_computer/{computer_id}', {
+            'computer_id': serial, 'company': company, 'model': model, 'cpu': cpu, 'os': os_name,
+            'user_id': owner, 'location': 'Office', 'room': room, 'ram': 16, 'storage': 512,
+            'date_inventoried': '2024-01-15', 'price': '1200'}
+
+    return {
+        'home': lambda rng: ('GET', '/', None),
+        'search': search,
+        'user_profile': lambda rng: ('GET', f'/user/{int(users * rng.random() ** 3) + 1}', None),
+        'computer_profile': lambda rng: ('GET', f'/computer/{rng.randrange(computers) + 1}', None),
+        'add_ticket': add_ticket_form,
+        'add_ticket_post': add_ticket_post,
+        'edit_computer': edit_computer_form,
+        'edit_computer_post': edit_computer_post,
+        'admin': lambda rng: ('GET', '/admin', None),
+        'replacement_report': lambda rng: ('GET', '/reports/replacements', None),
+        'ticket_report': lambda rng: ('GET', '/reports/tickets', None),
+    }
+
+
+class QueryCounter:
+    # WSGI middleware that counts the SQL statements run for each request and
+    # returns the count in an X-Query-Count header. Requests are handled on one
+    # thread each, so a thread-local count is enough.
+    def __init__(self, wsgi_app, engine):
+        from sqlalchemy import event
+        self.wsgi_app = wsgi_app
+        self.local = threading.local()
+        event.listen(engine, 'before_cursor_execute', self.count)
+
+    def count(self, *args):
+        self.local.queries = getattr(self.local, 'queries', 0) + 1
+
+    def __call__(self, environ, start_response):
+        self.local.queries = 0
+
+        def counted_start_response(status, headers, exc_info=None):
+            return start_response(status, headers + [('X-Query-Count', str(self.local.queries))], exc_info)
+        return self.wsgi_app(environ, counted_start_response)
+
+
+def summarize(samples, elapsed=None):
+    latencies = sorted(sample[0] * 1000 for sample in samples)
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0]
+    summary = {
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample[2] >= 400),
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'p50_ms': round(p50, 3),
+        'p95_ms': round(p95, 3),
+        'p99_ms': round(p99, 3),
+        'queries_per_request': round(statistics.fmean(sample[1] for sample in samples), 2),
+    }
+    if elapsed:
+        summary['requests_per_second'] = round(len(samples) / elapsed, 1)
+    return summary
+
+
+def run_test_client(app, pages, requests_per_page, warmup, rng):
+    client = app.test_client()
+    client.post('/login', data={'username': USERNAME, 'password': PASSWORD})
+    results = {}
+    for name, make_request in pages.items():
+        samples = []
+        timed = 0
+        for i in range(warmup + requests_per_page):
+            method, path, form = make_request(rng)
+            started = time.perf_counter()
+            response = client.open(path, method=method, data=form)
+            elapsed = time.perf_counter() - started
+            if i >= warmup:
+                timed += elapsed
+                samples.append((elapsed, int(response.headers['X-Query-Count']), response.status_code))
+        results[name] = summarize(samples, timed)
+    return results
+
+
+def run_threaded(app, pages, total_requests, threads, seed):
+    # Clients keep one HTTP/1.1 connection and session cookie each, and pick pages at random.
+    # Requests per second is only reported overall, since the clients share the server.
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    class QuietRequestHandler(WSGIRequestHandler):
+        def log_request(self, *args):
+            pass
+
+    server = make_server('127.0.0.1', 0, app.wsgi_app, threaded=True, request_handler=QuietRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    names = list(pages)
+    per_client = [total_requests // threads + (1 if i < total_requests % threads else 0) for i in range(threads)]
+
+    def client(index):
+        rng = random.Random(f'{seed}-{index}')
+        connection = http.client.HTTPConnection('127.0.0.1', server.server_port)
+        cookie = {}
+
+        def send(method, path, form=None):
+            headers = {'Cookie': '; '.join(f'{key}={value}' for key, value in cookie.items())}
+            body = None
+            if form is not None:
+                body = urlencode(form)
+                headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            for header in response.headers.get_all('Set-Cookie') or []:
+                key, _, value = header.split(';', 1)[0].partition('=')
+                cookie[key] = value
+            return response
+
+        send('POST', '/login', {'username': USERNAME, 'password': PASSWORD})
+        samples = []
+        for _ in range(per_client[index]):
+            name = rng.choice(names)
+            started = time.perf_counter()
+            response = send(*pages[name](rng))
+            samples.append((name, time.perf_counter() - started, int(response.headers['X-Query-Count']),
+                            response.status))
+        connection.close()
+        return samples
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        samples = [sample for client_samples in pool.map(client, range(threads)) for sample in client_samples]
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    by_page = {}
+    for name, *sample in samples:
+        by_page.setdefault(name, []).append(sample)
+    overall = summarize([sample[1:] for sample in samples], elapsed)
+    return {'threads': threads, **overall, 'pages': {name: summarize(by_page[name]) for name in pages if name in by_page}}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def print_results(results, baseline=None):
+    def row(name, summary, base):
+        rate = f'{summary["requests_per_second"]:>8.1f}' if 'requests_per_second' in summary else f'{"-":>8}'
+        line = (f'{name:<20} {summary["p50_ms"]:>8.1f} {summary["p95_ms"]:>8.1f} {summary["p99_ms"]:>8.1f} '
+                f'{summary["queries_per_request"]:>8.1f} {rate}')
+        if base:
+            change = (summary['p95_ms'] - base['p95_ms']) / base['p95_ms'] * 100 if base['p95_ms'] else 0
+            line += f' {change:>+8.1f}%'
+        if summary['errors']:
+            line += f'  ({summary["errors"]} errors)'
+        return line
+
+    header = f'{"":<20} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"queries":>8} {"req/s":>8}'
+    if baseline:
+        header += f' {"p95 vs":>9}'
+    print('Test client, one request at a time')
+    print(header)
+    for name, summary in results['test_client'].items():
+        print(row(name, summary, baseline and baseline['test_client'].get(name)))
+    threaded = results['threaded']
+    print()
+    print(f'Threaded server, {threaded["threads"]} clients')
+    print(header)
+    for name, summary in threaded['pages'].items():
+        print(row(name, summary, baseline and baseline['threaded']['pages'].get(name)))
+    print(row('all', threaded, baseline and baseline['threaded']))
+
+
+@click.command()
+@click.option('--users', default=2000, help='Number of users.')
+@click.option('--computers', default=2500, help='Number of computers, at least one per user.')
+@click.option('--tickets', default=20000, help='Number of tickets.')
+@click.option('--technicians', default=25, help='Number of technicians.')
+@click.option('--requests', 'requests_per_page', default=200, help='Timed test client requests per page.')
+@click.option('--warmup', default=20, help='Untimed requests per page before timing starts.')
+@click.option('--threads', default=8, help='Concurrent clients for the threaded server.')
+@click.option('--threaded-requests', default=2000, help='Total requests across all clients.')
+@click.option('--seed', default=0, help='Random seed, for reproducible runs.')
+@click.option('--database-url', help='Empty database to seed instead of a temporary SQLite file.')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write the results to this JSON file.')
+@click.option('--compare', type=click.File(), help='Earlier JSON results to compare p95 latency against.')
+def main(users, computers, tickets, technicians, requests_per_page, warmup, threads, threaded_requests, seed,
+         database_url, output, compare):
+    """Seed a synthetic database and load test the main pages."""
+    if computers < users:
+        raise click.BadParameter('there must be at least one computer per user', param_hint='--computers')
+    directory = None
+    if not database_url:
+        directory = tempfile.TemporaryDirectory()
+        database_url = 'sqlite:///' + os.path.join(directory.name, 'benchmark.db')
+    # The app reads its database from the environment when it is built
+    os.environ['DATABASE_URL'] = database_url
+    # Every client signs in as the same technician from the same address
+    os.environ['LOGIN_IP_BURST'] = os.environ['LOGIN_USERNAME_BURST'] = str(threads + 10)
+    import app as m
+    from flask_migrate import upgrade
+
+    app = m.create_app()
+    m.init_migrate(app)
+    # Keep the per-request log lines out of the report
+    app.logger.setLevel(logging.WARNING)
+    rng = random.Random(seed)
+    with app.app_context():
+        upgrade()
+        app.wsgi_app = QueryCounter(app.wsgi_app, m.db.engine)
+        if m.db.session.query(m.User.id).first() or m.db.session.query(m.TechnicianLogIn.id).first():
+            raise click.UsageError(f'{database_url} is not empty')
+        started = time.perf_counter()
+        seed_database(m, users, computers, tickets, technicians, rng)
+        print(f'Seeded {users} users, {computers} computers, {tickets} tickets, {technicians} technicians '
+              f'in {time.perf_counter() - started:.1f} s')
+        database = m.db.engine.dialect.name
+
+    pages = page_requests(m, app, users, computers, technicians)
+    results = {
+        'revision': git_revision(),
+        'database': database,
+        'config': {'users': users, 'computers': computers, 'tickets': tickets, 'technicians': technicians,
+                   'requests': requests_per_page, 'warmup': warmup, 'threads': threads,
+                   'threaded_requests': threaded_requests, 'seed': seed},
+        'test_client': run_test_client(app, pages, requests_per_page, warmup, rng),
+        'threaded': run_threaded(app, pages, threaded_requests, threads, seed),
+    }
+    print()
+    print_results(results, json.load(compare) if compare else None)
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+    if directory:
+        # Write out buffered audit entries while the database is still there
+        m.audit_log.flush()
+        with app.app_context():
+            m.db.engine.dispose()
+        directory.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Time how long the app takes to start.
+
+Starts a fresh Python process again and again and times, in each one, importing
+app.py, building the app, and its first request through the test client, then
+how long `flask run-worker --once` takes to start, find the queue empty and exit.
+These are the costs every worker, CLI command and test run pays before doing
+any work. Medians and p95s are written as JSON so runs can be diffed between
+versions, and --app-dir points the benchmark at another checkout, including
+ones from before the app had a create_app factory.
+
+    python benchmark_startup.py --app-dir ../roundtable-old -o before.json
+    python benchmark_startup.py -o after.json --compare before.json
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import click
+
+PHASES = ['import_ms', 'create_app_ms', 'first_request_ms', 'process_ms', 'worker_ms']
+
+# Run in each child process. Older checkouts build the app when app.py is
+# imported, so for them create_app_ms is zero and the work shows up in import_ms.
+CHILD = '''
+import json, time
+started = time.perf_counter()
+import app as m
+imported = time.perf_counter()
+application = m.create_app() if hasattr(m, 'create_app') else m.app
+created = time.perf_counter()
+application.test_client().get('/login')
+finished = time.perf_counter()
+print(json.dumps({'import_ms': (imported - started) * 1000, 'create_app_ms': (created - imported) * 1000,
+                  'first_request_ms': (finished - created) * 1000}))
+'''
+
+# Brings the database up to date before anything is timed. Older checkouts
+# create their tables when app.py is imported.
+PREPARE = '''
+import app as m
+if hasattr(m, 'create_app'):
+    from flask_migrate import upgrade
+    app = m.create_app()
+    m.init_migrate(app)
+    with app.app_context():
+        upgrade()
+'''
+
+
+def run(command, app_dir, env):
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=app_dir, env=env, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    if result.returncode:
+        raise click.ClickException(f'{" ".join(command[:3])} failed:\n{result.stderr}')
+    return result.stdout, elapsed
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    p95 = statistics.quantiles(samples, n=100, method='inclusive')[94] if len(samples) > 1 else samples[0]
+    return {'median_ms': round(statistics.median(samples), 1), 'p95_ms': round(p95, 1)}
+
+
+def git_revision(app_dir):
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=app_dir).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def print_results(results, baseline=None):
+    header = f'{"":<20} {"median":>8} {"p95":>8}'
+    if baseline:
+        header += f' {"median vs":>10}'
+    print(header)
+    for phase in PHASES:
+        summary = results['phases'][phase]
+        line = f'{phase:<20} {summary["median_ms"]:>8.1f} {summary["p95_ms"]:>8.1f}'
+        base = baseline and baseline['phases'].get(phase)
+        if base:
+            change = (summary['median_ms'] - base['median_ms']) / base['median_ms'] * 100 if base['median_ms'] else 0
+            line += f' {change:>+9.1f}%'
+        print(line)
+
+
+@click.command()
+@click.option('--runs', default=20, help='Cold starts to time.')
+@click.option('--app-dir', type=click.Path(file_okay=False, exists=True), default=os.path.dirname(os.path.abspath(__file__)),
+              help='Checkout to time (default: this one).')
+@click.option('--database-url', help='Database to start against instead of a temporary SQLite file.')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write the results to this JSON file.')
+@click.option('--compare', type=click.File(), help='Earlier JSON results to compare medians against.')
+def main(runs, app_dir, database_url, output, compare):
+    """Time cold starts of the app and of a background worker."""
+    directory = tempfile.TemporaryDirectory()
+    app_dir = os.path.abspath(app_dir)
+    env = dict(os.environ, DATABASE_URL=database_url or 'sqlite:///' + os.path.join(directory.name, 'startup.db'),
+               SECRET_KEY=os.getenv('SECRET_KEY', 'benchmark'), FLASK_APP='app', PYTHONPATH=app_dir)
+    env.pop('FLASK_DEBUG', None)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    run([sys.executable, '-c', PREPARE], app_dir, env)
+    # One untimed start, so every timed one finds the bytecode compiled and the files in the page cache
+    run([sys.executable, '-c', CHILD], app_dir, env)
+
+    samples = {phase: [] for phase in PHASES}
+    for _ in range(runs):
+        stdout, elapsed = run([sys.executable, '-c', CHILD], app_dir, env)
+        for phase, value in json.loads(stdout.splitlines()[-1]).items():
+            samples[phase].append(value)
+        samples['process_ms'].append(elapsed)
+        _, elapsed = run([sys.executable, '-m', 'flask', 'run-worker', '--once'], app_dir, env)
+        samples['worker_ms'].append(elapsed)
+    directory.cleanup()
+
+    results = {
+        'revision': git_revision(app_dir),
+        'database': env['DATABASE_URL'].split(':', 1)[0],
+        'runs': runs,
+        'phases': {phase: summarize(values) for phase, values in samples.items()},
+    }
+    print(f'{runs} cold starts of {app_dir}')
+    print_results(results, json.load(compare) if compare else None)
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""Create tables
+
+Revision ID: 0c5e1a7f3b26
+Revises:
+Create Date: 2026-10-18 16:20:08.514372
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0c5e1a7f3b26'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The tables as they were before the first migration, which the app used to
+    # create on startup. Databases made that way already have them.
+    if 'user' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table('user',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('full_name', sa.String(length=100), nullable=False),
+        sa.Column('pronouns', sa.String(length=20), nullable=True),
+        sa.Column('role', sa.Enum('Faculty', 'Staff', 'Other', name='user_role'), nullable=False),
+        sa.Column('department', sa.String(length=100), nullable=True),
+        sa.Column('office_number', sa.String(length=20), nullable=True),
+        sa.Column('cellphone_number', sa.String(length=20), nullable=True),
+        sa.Column('uniID', sa.String(length=20), nullable=False),
+        sa.Column('email', sa.String(length=120), nullable=False),
+        sa.Column('office_location', sa.String(length=100), nullable=True),
+        sa.Column('last_replaced_date', sa.DateTime(), nullable=True),
+        sa.Column('replacement_cycle_years', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email'),
+        sa.UniqueConstraint('uniID')
+    )
+    op.create_table('technician',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('full_name', sa.String(length=100), nullable=False),
+        sa.Column('pronouns', sa.String(length=20), nullable=True),
+        sa.Column('email', sa.String(length=120), nullable=False),
+        sa.Column('role', sa.Enum('Technician', 'Admin', name='technician_role'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email')
+    )
+    # technician_role was created with the technician table
+    op.create_table('technician_login',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=120), nullable=False),
+        sa.Column('password', sa.String(length=120), nullable=False),
+        sa.Column('role', sa.Enum('Technician', 'Admin', name='technician_role', create_type=False), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('username')
+    )
+    for table in ('company', 'model', 'cpu', 'os'):
+        op.create_table(table,
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('name')
+        )
+    op.create_table('computer',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('computer_id', sa.String(length=50), nullable=False),
+        sa.Column('model_id', sa.Integer(), nullable=False),
+        sa.Column('assigned_user_id', sa.Integer(), nullable=False),
+        sa.Column('location', sa.String(length=50), nullable=True),
+        sa.Column('room', sa.String(length=50), nullable=True),
+        sa.Column('cpu_id', sa.Integer(), nullable=False),
+        sa.Column('ram', sa.Integer(), nullable=True),
+        sa.Column('storage', sa.Integer(), nullable=True),
+        sa.Column('os_id', sa.Integer(), nullable=False),
+        sa.Column('date_inventoried', sa.DateTime(), nullable=True),
+        sa.Column('price', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['assigned_user_id'], ['user.id'], ),
+        sa.ForeignKeyConstraint(['company_id'], ['company.id'], ),
+        sa.ForeignKeyConstraint(['cpu_id'], ['cpu.id'], ),
+        sa.ForeignKeyConstraint(['model_id'], ['model.id'], ),
+        sa.ForeignKeyConstraint(['os_id'], ['os.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('computer_id')
+    )
+    op.create_table('ticket',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('computer_id', sa.Integer(), nullable=True),
+        sa.Column('issue_summary', sa.String(length=200), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('appointment_time', sa.DateTime(), nullable=True),
+        sa.Column('appointment_length', sa.Integer(), nullable=False),
+        sa.Column('assigned_person_id', sa.Integer(), nullable=True),
+        sa.Column('location', sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(['assigned_person_id'], ['technician.id'], ),
+        sa.ForeignKeyConstraint(['computer_id'], ['computer.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    for table in ('ticket', 'computer', 'os', 'cpu', 'model', 'company', 'technician_login', 'technician', 'user'):
+        op.drop_table(table)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP TYPE IF EXISTS technician_role')
+        op.execute('DROP TYPE IF EXISTS user_role')
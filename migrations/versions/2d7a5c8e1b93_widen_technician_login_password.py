@@ -0,0 +1,29 @@
+"""Widen technician_login.password
+
+Revision ID: 2d7a5c8e1b93
+Revises: 9f3b6d2e8a41
+Create Date: 2026-10-18 13:40:05.227614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d7a5c8e1b93'
+down_revision = '9f3b6d2e8a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite ignores VARCHAR lengths, PostgreSQL rejects scrypt hashes in 120 characters
+    with op.batch_alter_table('technician_login', schema=None) as batch_op:
+        batch_op.alter_column('password', existing_type=sa.String(length=120), type_=sa.String(length=255),
+                              existing_nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('technician_login', schema=None) as batch_op:
+        batch_op.alter_column('password', existing_type=sa.String(length=255), type_=sa.String(length=120),
+                              existing_nullable=False)
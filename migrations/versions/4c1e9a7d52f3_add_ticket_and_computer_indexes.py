@@ -0,0 +1,41 @@
+"""Add ticket and computer indexes
+
+Revision ID: 4c1e9a7d52f3
+Revises: b7d2801ab1aa
+Create Date: 2026-10-18 09:12:31.418220
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c1e9a7d52f3'
+down_revision = 'b7d2801ab1aa'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('computer', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_computer_assigned_user_id'), ['assigned_user_id'], unique=False)
+
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_ticket_user_id'), ['user_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_ticket_computer_id'), ['computer_id'], unique=False)
+        batch_op.create_index('ix_ticket_open_appointment', ['appointment_time', 'id'], unique=False,
+                              sqlite_where=sa.text("status != 'Closed'"), postgresql_where=sa.text("status != 'Closed'"))
+        batch_op.create_index('ix_ticket_status_appointment', ['status', 'appointment_time', 'id'], unique=False)
+        batch_op.create_index('ix_ticket_technician_appointment', ['assigned_person_id', 'appointment_time', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.drop_index('ix_ticket_technician_appointment')
+        batch_op.drop_index('ix_ticket_status_appointment')
+        batch_op.drop_index('ix_ticket_open_appointment')
+        batch_op.drop_index(batch_op.f('ix_ticket_computer_id'))
+        batch_op.drop_index(batch_op.f('ix_ticket_user_id'))
+
+    with op.batch_alter_table('computer', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_computer_assigned_user_id'))
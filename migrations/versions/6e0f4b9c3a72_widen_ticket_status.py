@@ -0,0 +1,33 @@
+"""Widen ticket.status
+
+Revision ID: 6e0f4b9c3a72
+Revises: 2d7a5c8e1b93
+Create Date: 2026-10-18 20:31:44.910382
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e0f4b9c3a72'
+down_revision = '2d7a5c8e1b93'
+branch_labels = None
+depends_on = None
+
+
+# 'Further Research Needed' does not fit in 20 characters on PostgreSQL. SQLite
+# ignores the length, and a batch alter there would rebuild the ticket table and
+# drop the search index triggers, so it is left alone.
+def upgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+    op.alter_column('ticket', 'status', existing_type=sa.String(length=20), type_=sa.String(length=30),
+                    existing_nullable=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+    op.alter_column('ticket', 'status', existing_type=sa.String(length=30), type_=sa.String(length=20),
+                    existing_nullable=True)
@@ -0,0 +1,37 @@
+"""Add updated_at to user, computer and ticket
+
+Revision ID: 8b4f1d6a2c57
+Revises: 6e0f4b9c3a72
+Create Date: 2026-10-18 22:14:09.518230
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4f1d6a2c57'
+down_revision = '6e0f4b9c3a72'
+branch_labels = None
+depends_on = None
+
+TABLES = ['user', 'computer', 'ticket']
+
+
+# The columns are added without batch mode, which would rebuild the tables on
+# SQLite and drop the search index triggers. Existing rows start at the time of
+# the upgrade.
+def upgrade():
+    now = datetime.utcnow()
+    for table in TABLES:
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(sa.table(table, sa.column('updated_at')).update().values(updated_at=now))
+        op.create_index(f'ix_{table}_updated_at', table, ['updated_at'], unique=False)
+
+
+def downgrade():
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_updated_at', table_name=table)
+        op.drop_column(table, 'updated_at')
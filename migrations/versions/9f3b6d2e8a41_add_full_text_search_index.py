@@ -0,0 +1,89 @@
+"""Add full-text search index
+
+Revision ID: 9f3b6d2e8a41
+Revises: 4c1e9a7d52f3
+Create Date: 2026-10-18 11:02:47.903115
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f3b6d2e8a41'
+down_revision = '4c1e9a7d52f3'
+branch_labels = None
+depends_on = None
+
+
+USER_SEARCH_ROWS = """
+    SELECT u.id, u.full_name, u.email, coalesce(u.department, ''), coalesce(u.office_location, ''),
+           coalesce((SELECT group_concat(t.issue_summary, ' ') FROM ticket t WHERE t.user_id = u.id), '')
+    FROM "user" u"""
+
+COMPUTER_SEARCH_ROWS = """
+    SELECT c.id, c.computer_id, coalesce(co.name, ''), coalesce(m.name, ''),
+           coalesce(c.location, '') || ' ' || coalesce(c.room, ''),
+           coalesce((SELECT group_concat(t.issue_summary, ' ') FROM ticket t WHERE t.computer_id = c.id), '')
+    FROM computer c
+    LEFT JOIN company co ON co.id = c.company_id
+    LEFT JOIN model m ON m.id = c.model_id"""
+
+
+def reindex_user_sql(user_id):
+    return (f"DELETE FROM user_search WHERE rowid = {user_id}; "
+            f"INSERT INTO user_search (rowid, full_name, email, department, office_location, tickets) "
+            f"{USER_SEARCH_ROWS} WHERE u.id = {user_id};")
+
+
+def reindex_computer_sql(computer_id):
+    return (f"DELETE FROM computer_search WHERE rowid = {computer_id}; "
+            f"INSERT INTO computer_search (rowid, serial, company, model, location, tickets) "
+            f"{COMPUTER_SEARCH_ROWS} WHERE c.id = {computer_id};")
+
+
+TRIGGERS = {
+    'user_search_insert': f'AFTER INSERT ON "user" BEGIN {reindex_user_sql("NEW.id")} END',
+    'user_search_update': f'AFTER UPDATE OF full_name, email, department, office_location ON "user" '
+                          f'BEGIN {reindex_user_sql("OLD.id")} {reindex_user_sql("NEW.id")} END',
+    'user_search_delete': 'AFTER DELETE ON "user" BEGIN DELETE FROM user_search WHERE rowid = OLD.id; END',
+    'computer_search_insert': f'AFTER INSERT ON computer BEGIN {reindex_computer_sql("NEW.id")} END',
+    'computer_search_update': f'AFTER UPDATE OF computer_id, company_id, model_id, location, room ON computer '
+                              f'BEGIN {reindex_computer_sql("OLD.id")} {reindex_computer_sql("NEW.id")} END',
+    'computer_search_delete': 'AFTER DELETE ON computer BEGIN DELETE FROM computer_search WHERE rowid = OLD.id; END',
+    'ticket_search_insert': f'AFTER INSERT ON ticket '
+                            f'BEGIN {reindex_user_sql("NEW.user_id")} {reindex_computer_sql("NEW.computer_id")} END',
+    'ticket_search_update': f'AFTER UPDATE OF issue_summary, user_id, computer_id ON ticket '
+                            f'BEGIN {reindex_user_sql("OLD.user_id")} {reindex_user_sql("NEW.user_id")} '
+                            f'{reindex_computer_sql("OLD.computer_id")} {reindex_computer_sql("NEW.computer_id")} END',
+    'ticket_search_delete': f'AFTER DELETE ON ticket '
+                            f'BEGIN {reindex_user_sql("OLD.user_id")} {reindex_computer_sql("OLD.computer_id")} END',
+}
+
+
+def upgrade():
+    # FTS5 is SQLite only; other databases keep using LIKE queries for /search
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS user_search USING fts5("
+               "full_name, email, department, office_location, tickets, prefix='2 3')")
+    op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS computer_search USING fts5("
+               "serial, company, model, location, tickets, prefix='2 3')")
+    for name, body in TRIGGERS.items():
+        op.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+
+    op.execute("DELETE FROM user_search")
+    op.execute(f"INSERT INTO user_search (rowid, full_name, email, department, office_location, tickets) {USER_SEARCH_ROWS}")
+    op.execute("DELETE FROM computer_search")
+    op.execute(f"INSERT INTO computer_search (rowid, serial, company, model, location, tickets) {COMPUTER_SEARCH_ROWS}")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for name in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name}')
+    op.execute("DROP TABLE IF EXISTS computer_search")
+    op.execute("DROP TABLE IF EXISTS user_search")
@@ -0,0 +1,99 @@
+"""Add ticket analytics
+
+Revision ID: a4d7e2b9f351
+Revises: e5b2c9d4a618
+Create Date: 2026-10-19 09:41:05.228714
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d7e2b9f351'
+down_revision = 'e5b2c9d4a618'
+branch_labels = None
+depends_on = None
+
+
+ticket = sa.table('ticket',
+    sa.column('id', sa.Integer), sa.column('status', sa.String), sa.column('created_at', sa.DateTime),
+    sa.column('updated_at', sa.DateTime), sa.column('assigned_person_id', sa.Integer),
+    sa.column('location', sa.String))
+
+ticket_event = sa.table('ticket_event',
+    sa.column('ticket_id', sa.Integer), sa.column('kind', sa.String), sa.column('at', sa.DateTime),
+    sa.column('day', sa.Date), sa.column('status', sa.String), sa.column('technician_id', sa.Integer),
+    sa.column('location', sa.String))
+
+
+def upgrade():
+    op.create_table('ticket_event',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('at', sa.DateTime(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=30), nullable=True),
+    sa.Column('technician_id', sa.Integer(), nullable=True),
+    sa.Column('location', sa.String(length=100), nullable=True),
+    sa.Column('previous_status', sa.String(length=30), nullable=True),
+    sa.Column('previous_technician_id', sa.Integer(), nullable=True),
+    sa.Column('previous_location', sa.String(length=100), nullable=True),
+    sa.Column('open_seconds', sa.Integer(), nullable=True),
+    sa.Column('changed_by', sa.String(length=120), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ticket_event_ticket_id', 'ticket_event', ['ticket_id'], unique=False)
+    op.create_table('ticket_daily_rollup',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=False),
+    sa.Column('opened', sa.Integer(), nullable=False),
+    sa.Column('closed', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'technician_id')
+    )
+    op.create_table('ticket_close_time_rollup',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('technician_id', sa.Integer(), nullable=False),
+    sa.Column('bucket_hours', sa.Integer(), nullable=False),
+    sa.Column('closes', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'technician_id', 'bucket_hours')
+    )
+    op.create_table('ticket_backlog_rollup',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('location', sa.String(length=100), nullable=False),
+    sa.Column('change', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'location')
+    )
+    op.create_table('analytics_state',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    # Start the history from the existing tickets: an open at created_at, and
+    # for closed tickets a close at their last update. The close time of those
+    # is unknown, so they are left out of the close time figures.
+    bind = op.get_bind()
+    opened_at = sa.func.coalesce(ticket.c.created_at, ticket.c.updated_at, sa.func.current_timestamp())
+    closed_at = sa.func.coalesce(ticket.c.updated_at, opened_at)
+    if bind.dialect.name == 'sqlite':
+        day = sa.func.date
+    else:
+        day = lambda at: sa.cast(at, sa.Date)
+    columns = ['ticket_id', 'kind', 'at', 'day', 'status', 'technician_id', 'location']
+    op.execute(ticket_event.insert().from_select(columns, sa.select(
+        ticket.c.id, sa.literal('opened'), opened_at, day(opened_at), sa.literal('Open'),
+        ticket.c.assigned_person_id, ticket.c.location).order_by(ticket.c.id)))
+    op.execute(ticket_event.insert().from_select(columns, sa.select(
+        ticket.c.id, sa.literal('closed'), closed_at, day(closed_at), ticket.c.status,
+        ticket.c.assigned_person_id, ticket.c.location).where(ticket.c.status == 'Closed').order_by(ticket.c.id)))
+
+
+def downgrade():
+    op.drop_table('analytics_state')
+    op.drop_table('ticket_backlog_rollup')
+    op.drop_table('ticket_close_time_rollup')
+    op.drop_table('ticket_daily_rollup')
+    op.drop_index('ix_ticket_event_ticket_id', table_name='ticket_event')
+    op.drop_table('ticket_event')
@@ -1,7 +1,7 @@
 """Initial migration
 
 Revision ID: b7d2801ab1aa
-Revises: 
+Revises: 0c5e1a7f3b26
 Create Date: 2024-12-29 17:10:42.691157
 
 """
@@ -11,16 +11,21 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = 'b7d2801ab1aa'
-down_revision = None
+down_revision = '0c5e1a7f3b26'
 branch_labels = None
 depends_on = None
 
 
 def upgrade():
+    # Databases the app created on startup got the column with the table
+    columns = [column['name'] for column in sa.inspect(op.get_bind()).get_columns('technician_login')]
+    if 'email' in columns:
+        return
+
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table('technician_login', schema=None) as batch_op:
         batch_op.add_column(sa.Column('email', sa.String(length=120), nullable=False))
-        batch_op.create_unique_constraint(None, ['email'])
+        batch_op.create_unique_constraint('uq_technician_login_email', ['email'])
 
     # ### end Alembic commands ###
 
@@ -28,7 +33,7 @@ def upgrade():
 def downgrade():
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table('technician_login', schema=None) as batch_op:
-        batch_op.drop_constraint(None, type_='unique')
+        batch_op.drop_constraint('uq_technician_login_email', type_='unique')
         batch_op.drop_column('email')
 
     # ### end Alembic commands ###
@@ -0,0 +1,32 @@
+"""Add ticket_change log
+
+Revision ID: c3e8a5f17d40
+Revises: 8b4f1d6a2c57
+Create Date: 2026-10-18 23:02:51.204117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e8a5f17d40'
+down_revision = '8b4f1d6a2c57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ticket_change',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=10), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ticket_change_created_at', 'ticket_change', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_ticket_change_created_at', table_name='ticket_change')
+    op.drop_table('ticket_change')
@@ -0,0 +1,35 @@
+"""Add audit log
+
+Revision ID: d2f6a8c3e175
+Revises: a4d7e2b9f351
+Create Date: 2026-10-19 14:06:52.417390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f6a8c3e175'
+down_revision = 'a4d7e2b9f351'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('audit_log',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=10), nullable=False),
+    sa.Column('changes', sa.Text(), nullable=True),
+    sa.Column('changed_by', sa.String(length=120), nullable=True),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_audit_log_entity', 'audit_log', ['entity_type', 'entity_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_audit_log_entity', table_name='audit_log')
+    op.drop_table('audit_log')
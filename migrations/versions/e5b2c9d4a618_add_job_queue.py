@@ -0,0 +1,47 @@
+"""Add job queue
+
+Revision ID: e5b2c9d4a618
+Revises: c3e8a5f17d40
+Create Date: 2026-10-19 00:12:37.846301
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b2c9d4a618'
+down_revision = 'c3e8a5f17d40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('job',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('progress', sa.Float(), nullable=False),
+    sa.Column('message', sa.String(length=200), nullable=True),
+    sa.Column('result', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('submitted_by', sa.String(length=120), nullable=True),
+    sa.Column('worker', sa.String(length=120), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_created_at', 'job', ['created_at'], unique=False)
+    op.create_index('ix_job_status_run_after', 'job', ['status', 'run_after', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_job_status_run_after', table_name='job')
+    op.drop_index('ix_job_created_at', table_name='job')
+    op.drop_table('job')
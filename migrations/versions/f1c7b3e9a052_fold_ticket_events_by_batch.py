@@ -0,0 +1,48 @@
+"""Fold ticket events by batch
+
+Revision ID: f1c7b3e9a052
+Revises: d2f6a8c3e175
+Create Date: 2026-10-20 10:12:37.604118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c7b3e9a052'
+down_revision = 'd2f6a8c3e175'
+branch_labels = None
+depends_on = None
+
+
+ticket_event = sa.table('ticket_event', sa.column('id', sa.Integer), sa.column('rollup_batch', sa.Integer))
+
+analytics_state = sa.table('analytics_state', sa.column('name', sa.String), sa.column('value', sa.Integer))
+
+
+def upgrade():
+    op.add_column('ticket_event', sa.Column('rollup_batch', sa.Integer(), nullable=True))
+    op.create_index('ix_ticket_event_rollup_batch', 'ticket_event', ['rollup_batch'], unique=False)
+
+    # Events up to the old id watermark are already in the rollups: mark them
+    # as folded by batch 0, the counter's starting value
+    bind = op.get_bind()
+    watermark = bind.execute(sa.select(analytics_state.c.value)
+                             .where(analytics_state.c.name == 'ticket_event_rollup')).scalar()
+    if watermark is not None:
+        op.execute(ticket_event.update().where(ticket_event.c.id <= watermark).values(rollup_batch=0))
+        op.execute(analytics_state.delete().where(analytics_state.c.name == 'ticket_event_rollup'))
+
+
+def downgrade():
+    # Back to a watermark below the first event that is not folded in yet
+    bind = op.get_bind()
+    unfolded = bind.execute(sa.select(sa.func.min(ticket_event.c.id))
+                            .where(ticket_event.c.rollup_batch.is_(None))).scalar()
+    if unfolded is None:
+        unfolded = (bind.execute(sa.select(sa.func.max(ticket_event.c.id))).scalar() or 0) + 1
+    op.execute(analytics_state.delete().where(analytics_state.c.name.in_(['ticket_event_rollup', 'ticket_event_rollup_batch'])))
+    op.execute(analytics_state.insert().values(name='ticket_event_rollup', value=unfolded - 1))
+    op.drop_index('ix_ticket_event_rollup_batch', table_name='ticket_event')
+    op.drop_column('ticket_event', 'rollup_batch')
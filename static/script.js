@@ -36,4 +36,130 @@ window.onload = function() {
     }
 
     updateThemeText();
+
+    // Search-as-you-type suggestions for the search box
+    const searchBox = document.getElementById('search-box');
+    const suggestions = document.getElementById('search-suggestions');
+    let suggestTimer = null;
+    let suggestRequest = 0;
+
+    if (searchBox && suggestions) {
+        searchBox.addEventListener('input', () => {
+            clearTimeout(suggestTimer);
+            suggestTimer = setTimeout(fetchSuggestions, 150);
+        });
+
+        searchBox.addEventListener('blur', () => {
+            // Give clicks on a suggestion time to land before hiding the list
+            setTimeout(() => { suggestions.hidden = true; }, 200);
+        });
+    }
+
+    function fetchSuggestions() {
+        const query = searchBox.value.trim();
+        if (!query) {
+            suggestions.hidden = true;
+            return;
+        }
+
+        const requestNumber = ++suggestRequest;
+        fetch(searchBox.dataset.suggestUrl + '?q=' + encodeURIComponent(query))
+            .then(response => response.json())
+            .then(data => {
+                // Ignore responses that arrive after a newer request was sent
+                if (requestNumber !== suggestRequest) {
+                    return;
+                }
+                suggestions.replaceChildren();
+                data.results.forEach(result => {
+                    const item = document.createElement('li');
+                    const link = document.createElement('a');
+                    link.href = result.url;
+                    link.textContent = result.label;
+                    item.appendChild(link);
+                    suggestions.appendChild(item);
+                });
+                suggestions.hidden = data.results.length === 0;
+            });
+    }
+
+    // Searchable selects: typing in a .remote-select box looks up matches on the
+    // server, and picking one stores its id in the hidden input named by data-target
+    document.querySelectorAll('.remote-select').forEach(box => {
+        const target = document.getElementById(box.dataset.target);
+        const options = box.parentElement.querySelector('.remote-select-options');
+        let timer = null;
+
+        box.addEventListener('input', () => {
+            target.value = '';
+            clearTimeout(timer);
+            timer = setTimeout(() => {
+                const query = box.value.trim();
+                if (!query) {
+                    options.hidden = true;
+                    return;
+                }
+                fetch(box.dataset.suggestUrl + '&q=' + encodeURIComponent(query))
+                    .then(response => response.json())
+                    .then(data => {
+                        options.replaceChildren();
+                        data.results.forEach(result => {
+                            const item = document.createElement('li');
+                            item.textContent = result.label;
+                            item.addEventListener('mousedown', () => {
+                                box.value = result.label;
+                                target.value = result.id;
+                                options.hidden = true;
+                            });
+                            options.appendChild(item);
+                        });
+                        options.hidden = data.results.length === 0;
+                    });
+            }, 150);
+        });
+
+        box.addEventListener('blur', () => {
+            setTimeout(() => { options.hidden = true; }, 200);
+        });
+    });
+
+    // Live updates for the open tickets table on the home page. Changed rows
+    // are replaced in place, closed and deleted tickets are removed, and new
+    // tickets are inserted in appointment order if they fall on this page.
+    const ticketTable = document.getElementById('open-tickets');
+
+    if (ticketTable && window.EventSource) {
+        const rows = ticketTable.tBodies[0];
+        // Rows outside the first and last appointment shown belong to other pages
+        const first = ticketTable.dataset.paged && rows.rows.length ? rows.rows[0].dataset.sort : '';
+        const last = ticketTable.dataset.more && rows.rows.length ? rows.rows[rows.rows.length - 1].dataset.sort : '';
+        const stream = new EventSource(ticketTable.dataset.streamUrl + '?since=' + ticketTable.dataset.since);
+
+        stream.addEventListener('ticket', event => {
+            const change = JSON.parse(event.data);
+            const existing = document.getElementById('ticket-' + change.id);
+            if (existing) {
+                existing.remove();
+            }
+            if (!change.html) {
+                return;
+            }
+
+            const template = document.createElement('template');
+            template.innerHTML = change.html;
+            const row = template.content.querySelector('tr');
+            const sort = row.dataset.sort;
+            if ((first && sort < first) || (last && sort > last)) {
+                return;
+            }
+            const next = Array.from(rows.rows).find(other => other.dataset.sort > sort);
+            rows.insertBefore(row, next || null);
+        });
+
+        // The server no longer has the changes since this page was rendered
+        stream.addEventListener('reload', () => {
+            stream.close();
+            window.location.reload();
+        });
+    }
 }
\ No newline at end of file